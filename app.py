@@ -2,25 +2,24 @@
 Auditor de Atendimento - Interface Web
 Aplicação Streamlit para análise de qualidade de atendimento
 """
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 try:
     import PyPDF2
 except ImportError:
     PyPDF2 = None
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
-import tempfile
+from charset_normalizer import from_bytes
+import datetime
+import io
 import os
-import sys
-from pathlib import Path
-
-# Adiciona o diretório auditor ao path
-sys.path.append(str(Path(__file__).parent / "auditor"))
 
 from auditor.analisador import AnalisadorAtendimento
-from auditor.criterios import CriteriosAvaliacao
+
+# Codificações esperadas em exportações de conversas em português
+CODIFICACOES_TEXTO = ['utf_8', 'cp1252', 'latin_1']
 
 
 def main():
@@ -92,44 +91,60 @@ def main():
                         exibir_resultados(resultado)
 
 
+@st.cache_resource
+def get_analisador():
+    """Retorna o analisador compartilhado entre execuções e sessões"""
+    return AnalisadorAtendimento()
+
+
 def analisar_arquivo_upload(uploaded_file):
     try:
-        if uploaded_file.name.lower().endswith('.pdf'):
-            if PyPDF2 is None:
-                st.error("PyPDF2 não está instalado. Adicione 'PyPDF2' ao requirements.txt.")
-                return None
-            texto = extrair_texto_pdf(uploaded_file)
-            if not texto.strip():
-                st.error("Não foi possível extrair texto do PDF. Verifique se o PDF não é escaneado/imagem.")
-                return None
-            # Salva texto extraído em arquivo temporário
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as tmp_file:
-                tmp_file.write(texto)
-                tmp_file_path = tmp_file.name
-            analisador = AnalisadorAtendimento()
-            resultado = analisador.analisar_conversa(tmp_file_path)
-            os.unlink(tmp_file_path)
-            return resultado
-        else:
-            # TXT normal
-            try:
-                content = uploaded_file.getvalue().decode('utf-8')
-            except UnicodeDecodeError:
-                content = uploaded_file.getvalue().decode('latin1')
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as tmp_file:
-                tmp_file.write(content)
-                tmp_file_path = tmp_file.name
-            analisador = AnalisadorAtendimento()
-            resultado = analisador.analisar_conversa(tmp_file_path)
-            os.unlink(tmp_file_path)
-            return resultado
+        eh_pdf = uploaded_file.name.lower().endswith('.pdf')
+        if eh_pdf and pdfium is None and PyPDF2 is None:
+            st.error("Nenhum leitor de PDF instalado. Adicione 'pypdfium2' ao requirements.txt.")
+            return None
+        resultado = _analisar_bytes(uploaded_file.getvalue(), eh_pdf)
+        if resultado is None:
+            st.error("Não foi possível extrair texto do PDF. Verifique se o PDF não é escaneado/imagem.")
+            return None
+        return _atualizar_data_analise(resultado)
     except Exception as e:
         st.error(f"❌ Erro ao analisar arquivo: {e}")
         return None
-        
-def extrair_texto_pdf(uploaded_file):
+
+
+def _atualizar_data_analise(resultado):
+    """Marca o resultado com o horário desta análise, e não o da entrada em cache"""
+    # st.cache_data devolve uma cópia, então alterar o dicionário não afeta o cache
+    resultado["data_analise"] = datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+    return resultado
+
+
+@st.cache_data(show_spinner=False)
+def _analisar_bytes(dados, eh_pdf):
+    """Analisa o conteúdo enviado; reenvios do mesmo arquivo reaproveitam o resultado"""
+    if eh_pdf:
+        texto = extrair_texto_pdf(dados)
+        if not texto.strip():
+            return None
+    else:
+        # TXT normal: detecta a codificação em uma única passagem
+        deteccao = from_bytes(dados, cp_isolation=CODIFICACOES_TEXTO).best()
+        texto = str(deteccao) if deteccao is not None else dados.decode('utf-8', errors='replace')
+    analisador = get_analisador()
+    return analisador.analisar_texto(texto)
+
+
+def extrair_texto_pdf(dados):
+    """Extrai o texto do PDF, preferindo o pypdfium2 e recorrendo ao PyPDF2"""
     try:
-        reader = PyPDF2.PdfReader(uploaded_file)
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(dados)
+            try:
+                return '\n'.join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+        reader = PyPDF2.PdfReader(io.BytesIO(dados))
         texto = ''
         for page in reader.pages:
             page_text = page.extract_text()
@@ -142,16 +157,26 @@ def extrair_texto_pdf(uploaded_file):
 def analisar_arquivo_local(arquivo_path):
     """Analisa um arquivo local"""
     try:
-        analisador = AnalisadorAtendimento()
-        resultado = analisador.analisar_conversa(arquivo_path)
-        return resultado
+        resultado = _analisar_arquivo_local(arquivo_path, os.path.getmtime(arquivo_path))
+        return _atualizar_data_analise(resultado)
     except Exception as e:
         st.error(f"❌ Erro ao analisar arquivo: {e}")
         return None
 
 
+@st.cache_data(show_spinner=False)
+def _analisar_arquivo_local(arquivo_path, modificado_em):
+    """Analisa um arquivo local; modificado_em invalida o cache quando o arquivo muda"""
+    analisador = get_analisador()
+    return analisador.analisar_conversa(arquivo_path)
+
+
 def exibir_resultados(resultado):
     """Exibe os resultados da análise de forma visual"""
+    # Bibliotecas de gráficos só são carregadas quando há resultado para exibir
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
     
     # Métricas principais
     col1, col2, col3, col4 = st.columns(4)
@@ -263,7 +288,7 @@ def exibir_resultados(resultado):
     
     # Critérios utilizados
     with st.expander("📊 Critérios de Avaliação"):
-        criterios = CriteriosAvaliacao()
+        criterios = get_analisador().criterios
         
         st.subheader("Palavras Positivas Reconhecidas")
         palavras = criterios.get_palavras_positivas()
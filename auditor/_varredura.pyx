@@ -0,0 +1,47 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Varredura compilada dos tempos de resposta
+Versão Cython de analisador._varrer_respostas_python, sem o custo de JIT na importação
+"""
+
+# Devem coincidir com _AUTOR_CLIENTE e _AUTOR_ATENDENTE em analisador.py
+cdef enum:
+    AUTOR_CLIENTE = 0
+    AUTOR_ATENDENTE = 1
+
+# Expostos para que os testes confiram a correspondência com analisador.py
+CODIGO_CLIENTE = AUTOR_CLIENTE
+CODIGO_ATENDENTE = AUTOR_ATENDENTE
+
+
+cpdef tuple varrer_respostas(const int[::1] tempos, const signed char[::1] autores):
+    """
+    Percorre os horários ordenados medindo o tempo de resposta do atendente
+
+    Args:
+        tempos: Horários em segundos desde 00:00:00 (-1 quando ausente)
+        autores: Código do autor de cada mensagem
+
+    Returns:
+        Tupla com (tempo_medio, respostas_lentas)
+    """
+    cdef double total = 0.0
+    cdef long respostas = 0
+    cdef long respostas_lentas = 0
+    cdef int ultimo_cliente = -1
+    cdef int tempo_resposta
+    cdef Py_ssize_t i
+
+    for i in range(tempos.shape[0]):
+        if autores[i] == AUTOR_CLIENTE:
+            ultimo_cliente = tempos[i]
+        elif autores[i] == AUTOR_ATENDENTE and ultimo_cliente >= 0 and tempos[i] >= 0:
+            tempo_resposta = tempos[i] - ultimo_cliente
+            total += tempo_resposta
+            respostas += 1
+
+            # Conta respostas lentas (>30 segundos)
+            if tempo_resposta > 30:
+                respostas_lentas += 1
+
+    return (total / respostas if respostas else 0.0), respostas_lentas
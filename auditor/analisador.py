@@ -5,32 +5,153 @@ Classe principal para análise de conversas e geração de relatórios
 
 import re
 import datetime
+from array import array
 from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 
 from .criterios import CriteriosAvaliacao
 
+try:
+    # Extensão Cython, construída com "python setup.py build_ext --inplace"
+    from ._varredura import varrer_respostas as _varrer_compilado
+except ImportError:  # Extensão não construída; recorre ao Numba
+    _varrer_compilado = None
 
-@dataclass
+np = None
+njit = None
+if _varrer_compilado is None:
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:  # Numba é opcional; sem ele a varredura roda em Python puro
+        np = None
+        njit = None
+
+
+# Padrão: [HH:MM:SS] Autor: Mensagem (uma mensagem por linha, hora opcional)
+# O lookahead impede que espaços iniciais sejam tomados como autor (ex.: "   : oi")
+_LINE_RE = re.compile(
+    r'^[^\S\n]*(?=[^\s:])(\[(\d{2}):(\d{2}):(\d{2})\])?[^\S\n]*([^:\n]+):[^\S\n]*(\S.*)$',
+    re.MULTILINE
+)
+
+# Códigos de autor usados nos vetores de análise
+_AUTOR_CLIENTE = 0
+_AUTOR_ATENDENTE = 1
+_AUTOR_OUTRO = 2
+_CODIGOS_AUTOR = {"cliente": _AUTOR_CLIENTE, "atendente": _AUTOR_ATENDENTE}
+
+
+def _varrer_respostas_python(tempos, autores) -> Tuple[float, int]:
+    """
+    Percorre os horários ordenados medindo o tempo de resposta do atendente
+    
+    Args:
+        tempos: Horários em segundos desde 00:00:00 (-1 quando ausente)
+        autores: Código do autor de cada mensagem
+        
+    Returns:
+        Tupla com (tempo_medio, respostas_lentas)
+    """
+    total = 0.0
+    respostas = 0
+    respostas_lentas = 0
+    ultimo_cliente = -1
+    
+    for i in range(len(tempos)):
+        if autores[i] == _AUTOR_CLIENTE:
+            ultimo_cliente = tempos[i]
+        elif autores[i] == _AUTOR_ATENDENTE and ultimo_cliente >= 0 and tempos[i] >= 0:
+            tempo_resposta = tempos[i] - ultimo_cliente
+            total += tempo_resposta
+            respostas += 1
+            
+            # Conta respostas lentas (>30 segundos)
+            if tempo_resposta > 30:
+                respostas_lentas += 1
+    
+    return (total / respostas if respostas else 0.0), respostas_lentas
+
+
+# Implementação de referência; as versões compiladas devem produzir o mesmo resultado
+_varrer_respostas = _varrer_respostas_python
+if _varrer_compilado is not None:
+    _varrer_respostas = _varrer_compilado
+elif njit is not None:
+    _varrer_respostas = njit(cache=True)(_varrer_respostas_python)
+    # Compila na importação para que a primeira análise não pague o custo do JIT
+    _varrer_respostas(np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int8))
+
+
+def _ordenar_por_horario(tempos: List[int], autores: List[int]):
+    """
+    Ordena os vetores de horários e autores pelo horário
+    
+    Em caso de empate, a mensagem do cliente vem antes da resposta. Os vetores
+    saem no formato esperado pela varredura ativa: arrays NumPy para o Numba,
+    array.array para a extensão compilada e listas para Python puro.
+    
+    Args:
+        tempos: Horários em segundos desde 00:00:00 (-1 quando ausente)
+        autores: Código do autor de cada mensagem
+        
+    Returns:
+        Tupla com (tempos, autores) ordenados
+    """
+    if njit is not None:
+        tempos = np.array(tempos, dtype=np.int32)
+        autores = np.array(autores, dtype=np.int8)
+        chave = tempos.astype(np.int64) * 2 + (autores != _AUTOR_CLIENTE)
+        ordem = np.argsort(chave, kind="stable")
+        return tempos[ordem], autores[ordem]
+    
+    ordem = sorted(range(len(tempos)), key=lambda i: tempos[i] * 2 + (autores[i] != _AUTOR_CLIENTE))
+    tempos = [tempos[i] for i in ordem]
+    autores = [autores[i] for i in ordem]
+    
+    if _varrer_compilado is not None:
+        return array('i', tempos), array('b', autores)
+    return tempos, autores
+
+
+@dataclass(slots=True)
 class Mensagem:
     """Representa uma mensagem da conversa"""
     timestamp: str
     autor: str
     conteudo: str
-    hora: Optional[datetime.time] = None
+    hora_seg: int = -1  # Segundos desde 00:00:00; -1 quando a linha não tem horário
+    autor_lower: str = field(init=False, repr=False)
     
     def __post_init__(self):
-        """Extrai a hora do timestamp após a inicialização"""
-        if self.timestamp:
-            self.hora = self._extrair_hora()
+        """Normaliza o autor uma única vez para as comparações da análise"""
+        self.autor_lower = self.autor.lower()
+    
+    @classmethod
+    def de_linha(cls, linha: str) -> Optional["Mensagem"]:
+        """
+        Cria uma mensagem a partir de uma linha no formato [HH:MM:SS] Autor: Mensagem
+        
+        Args:
+            linha: Linha da conversa
+            
+        Returns:
+            Mensagem ou None se a linha não estiver no formato esperado
+        """
+        match = _LINE_RE.match(linha)
+        return cls._de_match(match) if match else None
     
-    def _extrair_hora(self) -> datetime.time:
-        """Extrai a hora do timestamp [HH:MM:SS]"""
-        match = re.search(r'\[(\d{2}):(\d{2}):(\d{2})\]', self.timestamp)
-        if match:
-            hora, minuto, segundo = map(int, match.groups())
-            return datetime.time(hora, minuto, segundo)
-        return None
+    @classmethod
+    def _de_match(cls, match: "re.Match[str]") -> "Mensagem":
+        """Cria uma mensagem a partir dos grupos capturados por _LINE_RE"""
+        timestamp, hora, minuto, segundo, autor, conteudo = match.groups()
+        return cls(
+            timestamp or "",
+            autor.strip(),
+            conteudo.strip(),
+            int(hora) * 3600 + int(minuto) * 60 + int(segundo) if timestamp else -1
+        )
 
 
 class AnalisadorAtendimento:
@@ -53,24 +174,62 @@ class AnalisadorAtendimento:
         # Carrega e processa as mensagens
         mensagens = self._carregar_mensagens(arquivo_conversa)
         
-        # Separa mensagens por autor
-        mensagens_cliente = [m for m in mensagens if m.autor.lower() == "cliente"]
-        mensagens_atendente = [m for m in mensagens if m.autor.lower() == "atendente"]
+        return self._analisar_mensagens(mensagens)
+    
+    def analisar_texto(self, texto: str) -> Dict[str, Any]:
+        """
+        Analisa uma conversa já carregada em memória, sem passar por arquivo
+        
+        Args:
+            texto: Conteúdo da conversa
+            
+        Returns:
+            Dicionário com resultados da análise
+        """
+        # Mesma conversão de quebras de linha que a leitura em modo texto faz
+        texto = texto.replace('\r\n', '\n').replace('\r', '\n')
+        return self._analisar_mensagens(self._extrair_mensagens(texto))
+    
+    def _analisar_mensagens(self, mensagens: List[Mensagem]) -> Dict[str, Any]:
+        """
+        Executa a auditoria sobre as mensagens já extraídas
+        
+        Args:
+            mensagens: Lista de objetos Mensagem
+            
+        Returns:
+            Dicionário com resultados da análise
+        """
+        # Converte em vetores paralelos em uma única passagem;
+        # só o texto do atendente segue adiante
+        tempos = []
+        autores = []
+        conteudos_atendente = []
+        total_cliente = 0
+        for mensagem in mensagens:
+            autor = _CODIGOS_AUTOR.get(mensagem.autor_lower, _AUTOR_OUTRO)
+            tempos.append(mensagem.hora_seg)
+            autores.append(autor)
+            if autor == _AUTOR_CLIENTE:
+                total_cliente += 1
+            elif autor == _AUTOR_ATENDENTE:
+                conteudos_atendente.append(mensagem.conteudo)
+        
+        # Ordena uma única vez por horário; as análises seguintes assumem a ordem
+        tempos, autores = _ordenar_por_horario(tempos, autores)
         
         # Analisa palavras positivas
-        palavras_positivas = self._contar_palavras_positivas(mensagens_atendente)
+        palavras_positivas = self._contar_palavras_positivas(conteudos_atendente)
         
         # Analisa tempo de resposta
-        tempo_medio, respostas_lentas = self._analisar_tempo_resposta(
-            mensagens_cliente, mensagens_atendente
-        )
+        tempo_medio, respostas_lentas = self._analisar_tempo_resposta(tempos, autores)
         
         # Calcula durações
-        duracao_total = self._calcular_duracao_total(mensagens)
+        duracao_total = self._calcular_duracao_total(tempos)
         
         # Calcula avaliações
         nota_empatia = self.criterios.calcular_nota_empatia(
-            palavras_positivas, len(mensagens_atendente)
+            palavras_positivas, len(conteudos_atendente)
         )
         nota_tempo = self.criterios.calcular_nota_tempo(tempo_medio)
         media_final = self.criterios.calcular_media_final(nota_empatia, nota_tempo)
@@ -80,8 +239,8 @@ class AnalisadorAtendimento:
             "data_analise": datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
             "duracao_total": duracao_total,
             "total_mensagens": len(mensagens),
-            "mensagens_cliente": len(mensagens_cliente),
-            "mensagens_atendente": len(mensagens_atendente),
+            "mensagens_cliente": total_cliente,
+            "mensagens_atendente": len(conteudos_atendente),
             "palavras_positivas": palavras_positivas,
             "tempo_medio_resposta": tempo_medio,
             "respostas_lentas": respostas_lentas,
@@ -104,26 +263,10 @@ class AnalisadorAtendimento:
         Returns:
             Lista de objetos Mensagem
         """
-        mensagens = []
-        
         try:
-            with open(arquivo_conversa, 'r', encoding='utf-8') as arquivo:
-                linhas = arquivo.readlines()
-            
-            for linha in linhas:
-                linha = linha.strip()
-                if not linha:
-                    continue
-                
-                # Padrão: [HH:MM:SS] Autor: Mensagem
-                match = re.match(r'(\[\d{2}:\d{2}:\d{2}\])?\s*([^:]+):\s*(.+)', linha)
-                if match:
-                    timestamp = match.group(1) or ""
-                    autor = match.group(2).strip()
-                    conteudo = match.group(3).strip()
-                    
-                    mensagem = Mensagem(timestamp, autor, conteudo)
-                    mensagens.append(mensagem)
+            # Lê o arquivo inteiro de uma vez; a regex multilinha percorre o buffer
+            texto = Path(arquivo_conversa).read_text(encoding='utf-8')
+            mensagens = self._extrair_mensagens(texto)
         
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo '{arquivo_conversa}' não encontrado")
@@ -132,126 +275,81 @@ class AnalisadorAtendimento:
         
         return mensagens
     
-    def _contar_palavras_positivas(self, mensagens_atendente: List[Mensagem]) -> int:
+    def _extrair_mensagens(self, texto: str) -> List[Mensagem]:
+        """
+        Extrai as mensagens de um texto no formato [HH:MM:SS] Autor: Mensagem
+        
+        Args:
+            texto: Conteúdo completo da conversa
+            
+        Returns:
+            Lista de objetos Mensagem
+        """
+        return [Mensagem._de_match(match) for match in _LINE_RE.finditer(texto)]
+    
+    def _contar_palavras_positivas(self, conteudos_atendente: List[str]) -> int:
         """
         Conta palavras positivas nas mensagens do atendente
         
         Args:
-            mensagens_atendente: Lista de mensagens do atendente
+            conteudos_atendente: Conteúdo das mensagens do atendente
             
         Returns:
             Número de palavras positivas encontradas
         """
-        palavras_positivas = self.criterios.get_palavras_positivas()
-        total_encontradas = 0
-        
-        for mensagem in mensagens_atendente:
-            conteudo_lower = mensagem.conteudo.lower()
-            for palavra in palavras_positivas:
-                if palavra.lower() in conteudo_lower:
-                    total_encontradas += 1
-                    break  # Conta apenas uma vez por mensagem
-        
-        return total_encontradas
+        # Conta apenas uma vez por mensagem
+        return self.criterios.contar_mensagens_positivas(conteudos_atendente)
     
-    def _analisar_tempo_resposta(
-        self, mensagens_cliente: List[Mensagem], 
-        mensagens_atendente: List[Mensagem]
-    ) -> Tuple[float, int]:
+    def _analisar_tempo_resposta(self, tempos, autores) -> Tuple[float, int]:
         """
         Analisa o tempo de resposta entre cliente e atendente
         
         Args:
-            mensagens_cliente: Lista de mensagens do cliente
-            mensagens_atendente: Lista de mensagens do atendente
+            tempos: Horários das mensagens, em ordem crescente
+            autores: Código do autor de cada mensagem, na mesma ordem
             
         Returns:
             Tupla com (tempo_medio, respostas_lentas)
         """
-        tempos_resposta = []
-        respostas_lentas = 0
-        
-        # Combina todas as mensagens ordenadas por timestamp
-        todas_mensagens = mensagens_cliente + mensagens_atendente
-        todas_mensagens.sort(key=lambda m: m.hora or datetime.time(0, 0, 0))
-        
-        ultima_mensagem_cliente = None
-        
-        for mensagem in todas_mensagens:
-            if mensagem.autor.lower() == "cliente":
-                ultima_mensagem_cliente = mensagem
-            elif mensagem.autor.lower() == "atendente" and ultima_mensagem_cliente:
-                # Calcula tempo entre mensagem do cliente e resposta do atendente
-                tempo_resposta = self._calcular_diferenca_tempo(
-                    ultima_mensagem_cliente.hora, mensagem.hora
-                )
-                
-                if tempo_resposta is not None:
-                    tempos_resposta.append(tempo_resposta)
-                    
-                    # Conta respostas lentas (>30 segundos)
-                    if tempo_resposta > 30:
-                        respostas_lentas += 1
-        
-        # Calcula tempo médio
-        tempo_medio = sum(tempos_resposta) / len(tempos_resposta) if tempos_resposta else 0
-        
-        return tempo_medio, respostas_lentas
+        return _varrer_respostas(tempos, autores)
     
-    def _calcular_diferenca_tempo(self, hora1: Optional[datetime.time], hora2: Optional[datetime.time]) -> Optional[float]:
+    def _calcular_diferenca_tempo(self, segundos1: int, segundos2: int) -> Optional[int]:
         """
         Calcula a diferença em segundos entre dois horários
         
         Args:
-            hora1: Primeiro horário
-            hora2: Segundo horário
+            segundos1: Primeiro horário, em segundos desde 00:00:00
+            segundos2: Segundo horário, em segundos desde 00:00:00
             
         Returns:
-            Diferença em segundos ou None se inválido
+            Diferença em segundos ou None se algum horário estiver ausente
         """
-        if not hora1 or not hora2:
+        if segundos1 < 0 or segundos2 < 0:
             return None
         
-        # Converte para segundos
-        segundos1 = hora1.hour * 3600 + hora1.minute * 60 + hora1.second
-        segundos2 = hora2.hour * 3600 + hora2.minute * 60 + hora2.second
-        
         return segundos2 - segundos1
     
-    def _calcular_duracao_total(self, mensagens: List[Mensagem]) -> str:
+    def _calcular_duracao_total(self, tempos) -> str:
         """
         Calcula a duração total da conversa
         
         Args:
-            mensagens: Lista de todas as mensagens
+            tempos: Horários das mensagens, em ordem crescente
             
         Returns:
             String formatada com a duração
         """
-        if not mensagens:
-            return "00:00:00"
-        
-        # Ordena por timestamp
-        mensagens_ordenadas = sorted(
-            mensagens, 
-            key=lambda m: m.hora or datetime.time(0, 0, 0)
-        )
-        
-        primeira = mensagens_ordenadas[0].hora
-        ultima = mensagens_ordenadas[-1].hora
-        
-        if not primeira or not ultima:
+        if len(tempos) == 0:
             return "00:00:00"
         
         # Calcula diferença
-        segundos_total = self._calcular_diferenca_tempo(primeira, ultima)
+        segundos_total = self._calcular_diferenca_tempo(int(tempos[0]), int(tempos[-1]))
         
         if segundos_total is None or segundos_total < 0:
             return "00:00:00"
         
         # Converte para formato HH:MM:SS
-        horas = segundos_total // 3600
-        minutos = (segundos_total % 3600) // 60
-        segundos = segundos_total % 60
+        minutos, segundos = divmod(segundos_total, 60)
+        horas, minutos = divmod(minutos, 60)
         
         return f"{horas:02d}:{minutos:02d}:{segundos:02d}" 
\ No newline at end of file
@@ -3,7 +3,68 @@ Critérios de Avaliação para Auditoria de Atendimento
 Define palavras positivas, tempos de resposta e critérios de avaliação
 """
 
-from typing import List, Dict, Any
+import re
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+from typing import Tuple, Mapping, Pattern, Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick é opcional; sem ele a busca usa a regex compilada
+    ahocorasick = None
+
+
+# Critérios imutáveis, montados uma única vez na importação do módulo
+PALAVRAS_POSITIVAS: Tuple[str, ...] = (
+    "obrigado", "obrigada", "por favor", "vamos resolver", 
+    "fico à disposição", "entendo", "compreendo", "claro",
+    "certamente", "sem dúvida", "vou ajudar", "posso ajudar",
+    "vamos verificar", "vou verificar", "perfeito", "excelente",
+    "ótimo", "muito bem", "vamos lá", "tranquilo", "calma",
+    "paciência", "vou resolver", "vou cuidar", "fique tranquilo",
+    "não se preocupe", "vou fazer o possível", "vou tentar",
+    "vou investigar", "vou analisar"
+)
+
+TEMPO_RESPOSTA_LIMITES: Mapping[str, int] = MappingProxyType({
+    "excelente": 10,  # segundos
+    "bom": 20,
+    "regular": 30,
+    "ruim": 60
+})
+
+PESOS_AVALIACAO: Mapping[str, float] = MappingProxyType({
+    "empatia": 0.6,
+    "tempo_resposta": 0.4
+})
+
+# Uma única alternância compilada substitui a busca frase a frase
+_POSITIVAS_RE = re.compile(
+    "|".join(re.escape(palavra) for palavra in PALAVRAS_POSITIVAS),
+    re.IGNORECASE
+)
+
+# Autômato Aho-Corasick: uma única varredura encontra qualquer das frases
+if ahocorasick is not None:
+    _POSITIVAS_AUTOMATO = ahocorasick.Automaton()
+    for _palavra in PALAVRAS_POSITIVAS:
+        _POSITIVAS_AUTOMATO.add_word(_palavra.lower(), _palavra)
+    _POSITIVAS_AUTOMATO.make_automaton()
+    del _palavra
+else:
+    _POSITIVAS_AUTOMATO = None
+
+_PESO_EMPATIA = PESOS_AVALIACAO["empatia"]
+_PESO_TEMPO = PESOS_AVALIACAO["tempo_resposta"]
+
+# Faixas de nota em ordem crescente de limiar, consultadas com bisect.
+# Tempo: a nota é a da primeira faixa cujo limite comporta o tempo médio.
+_LIMIARES_TEMPO = tuple(sorted(TEMPO_RESPOSTA_LIMITES.values()))
+_NOTAS_TEMPO = (10.0, 8.0, 6.0, 4.0, 2.0)
+
+# Empatia: a nota é a da maior proporção mínima atingida.
+_LIMIARES_EMPATIA = (0.1, 0.2, 0.4, 0.6, 0.8)
+_NOTAS_EMPATIA = (2.0, 4.0, 5.5, 7.0, 8.5, 10.0)
 
 
 class CriteriosAvaliacao:
@@ -11,40 +72,42 @@ class CriteriosAvaliacao:
     
     def __init__(self):
         """Inicializa os critérios de avaliação"""
-        self.palavras_positivas = [
-            "obrigado", "obrigada", "por favor", "vamos resolver", 
-            "fico à disposição", "entendo", "compreendo", "claro",
-            "certamente", "sem dúvida", "vou ajudar", "posso ajudar",
-            "vamos verificar", "vou verificar", "perfeito", "excelente",
-            "ótimo", "muito bem", "vamos lá", "tranquilo", "calma",
-            "paciência", "vou resolver", "vou cuidar", "fique tranquilo",
-            "não se preocupe", "vou fazer o possível", "vou tentar",
-            "vou investigar", "vou analisar", "vou verificar"
-        ]
-        
-        self.tempo_resposta_limites = {
-            "excelente": 10,  # segundos
-            "bom": 20,
-            "regular": 30,
-            "ruim": 60
-        }
-        
-        self.pesos_avaliacao = {
-            "empatia": 0.6,
-            "tempo_resposta": 0.4
-        }
+        self.palavras_positivas = PALAVRAS_POSITIVAS
+        self.tempo_resposta_limites = TEMPO_RESPOSTA_LIMITES
+        self.pesos_avaliacao = PESOS_AVALIACAO
+    
+    def get_palavras_positivas(self) -> Tuple[str, ...]:
+        """Retorna as palavras positivas"""
+        return self.palavras_positivas
+    
+    def get_positivas_regex(self) -> Pattern[str]:
+        """Retorna a expressão regular compilada com todas as palavras positivas"""
+        return _POSITIVAS_RE
     
-    def get_palavras_positivas(self) -> List[str]:
-        """Retorna a lista de palavras positivas"""
-        return self.palavras_positivas.copy()
+    def contar_mensagens_positivas(self, conteudos: Iterable[str]) -> int:
+        """
+        Conta as mensagens que contêm ao menos uma palavra positiva
+        
+        Args:
+            conteudos: Conteúdo de cada mensagem
+            
+        Returns:
+            Número de mensagens com palavras positivas
+        """
+        if _POSITIVAS_AUTOMATO is not None:
+            return sum(
+                1 for conteudo in conteudos
+                if next(_POSITIVAS_AUTOMATO.iter(conteudo.lower()), None) is not None
+            )
+        return sum(1 for conteudo in conteudos if _POSITIVAS_RE.search(conteudo))
     
-    def get_tempo_limites(self) -> Dict[str, int]:
+    def get_tempo_limites(self) -> Mapping[str, int]:
         """Retorna os limites de tempo para avaliação"""
-        return self.tempo_resposta_limites.copy()
+        return self.tempo_resposta_limites
     
-    def get_pesos(self) -> Dict[str, float]:
+    def get_pesos(self) -> Mapping[str, float]:
         """Retorna os pesos para cálculo da média final"""
-        return self.pesos_avaliacao.copy()
+        return self.pesos_avaliacao
     
     def calcular_nota_tempo(self, tempo_medio: float) -> float:
         """
@@ -56,16 +119,7 @@ class CriteriosAvaliacao:
         Returns:
             Nota de 0 a 10
         """
-        if tempo_medio <= self.tempo_resposta_limites["excelente"]:
-            return 10.0
-        elif tempo_medio <= self.tempo_resposta_limites["bom"]:
-            return 8.0
-        elif tempo_medio <= self.tempo_resposta_limites["regular"]:
-            return 6.0
-        elif tempo_medio <= self.tempo_resposta_limites["ruim"]:
-            return 4.0
-        else:
-            return 2.0
+        return _NOTAS_TEMPO[bisect_left(_LIMIARES_TEMPO, tempo_medio)]
     
     def calcular_nota_empatia(self, palavras_encontradas: int, total_mensagens: int) -> float:
         """
@@ -85,18 +139,7 @@ class CriteriosAvaliacao:
         proporcao = palavras_encontradas / total_mensagens
         
         # Converte para nota de 0 a 10
-        if proporcao >= 0.8:
-            return 10.0
-        elif proporcao >= 0.6:
-            return 8.5
-        elif proporcao >= 0.4:
-            return 7.0
-        elif proporcao >= 0.2:
-            return 5.5
-        elif proporcao >= 0.1:
-            return 4.0
-        else:
-            return 2.0
+        return _NOTAS_EMPATIA[bisect_right(_LIMIARES_EMPATIA, proporcao)]
     
     def calcular_media_final(self, nota_empatia: float, nota_tempo: float) -> float:
         """
@@ -109,8 +152,5 @@ class CriteriosAvaliacao:
         Returns:
             Média final ponderada
         """
-        peso_empatia = self.pesos_avaliacao["empatia"]
-        peso_tempo = self.pesos_avaliacao["tempo_resposta"]
-        
-        media_final = (nota_empatia * peso_empatia) + (nota_tempo * peso_tempo)
+        media_final = (nota_empatia * _PESO_EMPATIA) + (nota_tempo * _PESO_TEMPO)
         return round(media_final, 1) 
\ No newline at end of file
@@ -6,13 +6,8 @@ Sistema para análise automática de qualidade de atendimento ao cliente
 
 import sys
 import os
-from pathlib import Path
-
-# Adiciona o diretório auditor ao path
-sys.path.append(str(Path(__file__).parent / "auditor"))
 
 from auditor.analisador import AnalisadorAtendimento
-from auditor.criterios import CriteriosAvaliacao
 
 
 def main():
@@ -0,0 +1,38 @@
+"""
+Instalação do Auditor de Atendimento, com a extensão compilada opcional
+
+Uso:
+    pip install .
+    pip install cython && python setup.py build_ext --inplace
+
+Sem o Cython instalado, o pacote é instalado sem a extensão e a análise
+usa a varredura em Numba ou em Python puro.
+"""
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "auditor._varredura",
+                ["auditor/_varredura.pyx"],
+                extra_compile_args=["-O3"]
+            )
+        ],
+        language_level=3
+    )
+
+
+setup(
+    name="auditor-atendimento",
+    packages=["auditor"],
+    ext_modules=ext_modules
+)
@@ -0,0 +1,8 @@
+"""
+Configuração dos testes: torna o pacote auditor importável a partir da raiz do projeto
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
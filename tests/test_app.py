@@ -0,0 +1,51 @@
+"""
+Testes da camada de cache da interface Streamlit
+"""
+
+import datetime
+import types
+
+import pytest
+
+app = pytest.importorskip("app")
+
+
+CONVERSA = "[10:00:00] Cliente: oi\n[10:00:20] Atendente: obrigado pelo contato\n".encode("utf-8")
+
+
+class _Arquivo:
+    """Imita o objeto devolvido por st.file_uploader"""
+
+    def __init__(self, nome, dados):
+        self.name = nome
+        self._dados = dados
+
+    def getvalue(self):
+        return self._dados
+
+
+def _relogio(*horarios):
+    """Substituto de datetime.datetime cujo now() devolve os horários em sequência"""
+    sequencia = iter(horarios)
+
+    class _Relogio(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(sequencia)
+
+    return types.SimpleNamespace(datetime=_Relogio)
+
+
+def test_data_analise_nao_vem_do_cache(monkeypatch):
+    app._analisar_bytes.clear()
+    monkeypatch.setattr(app, "datetime", _relogio(
+        datetime.datetime(2026, 1, 1, 9, 0, 0),
+        datetime.datetime(2026, 1, 1, 14, 30, 0),
+    ))
+
+    primeiro = app.analisar_arquivo_upload(_Arquivo("conversa.txt", CONVERSA))
+    segundo = app.analisar_arquivo_upload(_Arquivo("conversa.txt", CONVERSA))
+
+    assert primeiro["data_analise"] == "01/01/2026 09:00:00"
+    assert segundo["data_analise"] == "01/01/2026 14:30:00"
+    assert {**primeiro, "data_analise": None} == {**segundo, "data_analise": None}
@@ -0,0 +1,146 @@
+"""
+Testes de equivalência entre as implementações alternativas da análise
+
+A varredura de tempos de resposta existe em Python puro, Cython e Numba, e a
+busca de palavras positivas em Aho-Corasick e regex. As versões compiladas
+são opcionais; os testes de cada uma são ignorados quando ela não está instalada.
+"""
+
+import random
+from array import array
+from pathlib import Path
+
+import pytest
+
+from auditor import analisador, criterios
+from auditor.analisador import (
+    AnalisadorAtendimento,
+    _AUTOR_ATENDENTE,
+    _AUTOR_CLIENTE,
+    _AUTOR_OUTRO,
+    _varrer_respostas_python,
+)
+from auditor.criterios import CriteriosAvaliacao, PALAVRAS_POSITIVAS
+
+
+C, A, O = _AUTOR_CLIENTE, _AUTOR_ATENDENTE, _AUTOR_OUTRO
+
+# (tempos, autores, resultado esperado)
+CASOS_VARREDURA = [
+    ([], [], (0.0, 0)),
+    ([10, 20], [C, A], (10.0, 0)),
+    ([10, 50], [C, A], (40.0, 1)),
+    ([10, 40, 41], [C, A, A], (30.5, 1)),
+    ([-1, 5, 60], [C, A, A], (0.0, 0)),
+    ([-1, 10, 100], [A, C, A], (90.0, 1)),
+    ([0, 5, 10, 45], [C, O, C, A], (35.0, 1)),
+    ([10, 10, 20], [C, A, O], (0.0, 0)),
+    ([3600, 3630, 3631, 3700], [C, A, C, A], (49.5, 1)),
+]
+
+
+def _casos_aleatorios(quantidade=25, semente=7):
+    """Gera vetores ordenados com horários ausentes e autores de todos os tipos"""
+    gerador = random.Random(semente)
+    for _ in range(quantidade):
+        n = gerador.randint(0, 2000)
+        tempos = sorted(gerador.randint(-1, 86399) for _ in range(n))
+        autores = [gerador.choice([C, A, A, O]) for _ in range(n)]
+        yield tempos, autores
+
+
+@pytest.mark.parametrize("tempos, autores, esperado", CASOS_VARREDURA)
+def test_varredura_python_casos_fixos(tempos, autores, esperado):
+    assert _varrer_respostas_python(tempos, autores) == pytest.approx(esperado)
+
+
+def test_varredura_cython_equivale_a_python():
+    varredura = pytest.importorskip("auditor._varredura")
+
+    assert varredura.CODIGO_CLIENTE == _AUTOR_CLIENTE
+    assert varredura.CODIGO_ATENDENTE == _AUTOR_ATENDENTE
+
+    casos = [(t, a) for t, a, _ in CASOS_VARREDURA] + list(_casos_aleatorios())
+    for tempos, autores in casos:
+        compilado = varredura.varrer_respostas(array('i', tempos), array('b', autores))
+        assert compilado == _varrer_respostas_python(tempos, autores)
+
+
+def test_varredura_numba_equivale_a_python():
+    np = pytest.importorskip("numpy")
+    numba = pytest.importorskip("numba")
+    varrer_jit = numba.njit(_varrer_respostas_python)
+
+    casos = [(t, a) for t, a, _ in CASOS_VARREDURA] + list(_casos_aleatorios())
+    for tempos, autores in casos:
+        jit = varrer_jit(np.array(tempos, dtype=np.int32), np.array(autores, dtype=np.int8))
+        assert jit == _varrer_respostas_python(tempos, autores)
+
+
+def test_ordenacao_entrega_vetores_a_varredura_ativa():
+    tempos, autores = analisador._ordenar_por_horario([50, 10, 10, -1], [A, A, C, C])
+
+    assert list(tempos) == [-1, 10, 10, 50]
+    assert list(autores) == [C, C, A, A]
+    assert analisador._varrer_respostas(tempos, autores) == (20.0, 1)
+
+
+def _mensagens_teste(quantidade=3000, semente=3):
+    """Mistura frases positivas, variações de caixa e textos sem nenhuma frase"""
+    gerador = random.Random(semente)
+    fragmentos = list(PALAVRAS_POSITIVAS) + [
+        "ÓTIMO", "FICO À DISPOSIÇÃO", "Não Se Preocupe", "qualquer", "coisa",
+        "vou", "ver", "ifica", "r", ""
+    ]
+    return [
+        " ".join(gerador.choices(fragmentos, k=gerador.randint(0, 4)))
+        for _ in range(quantidade)
+    ]
+
+
+def test_palavras_positivas_regex_equivale_a_busca_original(monkeypatch):
+    monkeypatch.setattr(criterios, "_POSITIVAS_AUTOMATO", None)
+    mensagens = _mensagens_teste()
+
+    esperado = sum(
+        1 for mensagem in mensagens
+        if any(palavra in mensagem.lower() for palavra in PALAVRAS_POSITIVAS)
+    )
+    assert CriteriosAvaliacao().contar_mensagens_positivas(mensagens) == esperado
+
+
+def test_palavras_positivas_automato_equivale_a_regex(monkeypatch):
+    pytest.importorskip("ahocorasick")
+    assert criterios._POSITIVAS_AUTOMATO is not None
+    mensagens = _mensagens_teste()
+
+    com_automato = CriteriosAvaliacao().contar_mensagens_positivas(mensagens)
+    monkeypatch.setattr(criterios, "_POSITIVAS_AUTOMATO", None)
+    com_regex = CriteriosAvaliacao().contar_mensagens_positivas(mensagens)
+
+    assert com_automato == com_regex
+
+
+@pytest.mark.parametrize("texto, total", [
+    ("   : oi", 0),
+    (": oi", 0),
+    ("[10:00:00] Cliente: oi\n\n  [10:00:05] Atendente: olá  \n", 2),
+    ("[10:00:00] Cliente: oi\r[10:00:40] Atendente: obrigado\r", 2),
+    ("[10:00:00] Cliente: oi\r\n[10:00:40] Atendente: obrigado\r\n", 2),
+])
+def test_extracao_de_mensagens(texto, total):
+    assert AnalisadorAtendimento().analisar_texto(texto)["total_mensagens"] == total
+
+
+def test_exemplo_de_conversa():
+    exemplo = Path(__file__).resolve().parent.parent / "exemplos" / "exemplo_conversa.txt"
+    resultado = AnalisadorAtendimento().analisar_conversa(str(exemplo))
+
+    assert resultado["total_mensagens"] == 10
+    assert resultado["mensagens_cliente"] == 4
+    assert resultado["mensagens_atendente"] == 6
+    assert resultado["palavras_positivas"] == 6
+    assert resultado["respostas_lentas"] == 2
+    assert resultado["tempo_medio_resposta"] == pytest.approx(65 / 3)
+    assert resultado["duracao_total"] == "00:02:40"
+    assert resultado["avaliacoes"] == {"empatia": 10.0, "tempo_resposta": 6.0, "media_final": 8.4}